@@ -1,15 +1,20 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from review_summarizer import ReviewSummarizer, ReviewSummary
-from dataclasses import asdict
+from summary_serializer import SUPPORTED_ENCODINGS, compress_body, encode_summary
+import logging
+import os
 import sys  # for printing errors
 
+# Show the summarizer's progress messages
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
 # Initialize Flask app and CORS
 app = Flask(__name__)
 # This allows your frontend (on a file:// URL) to talk to your backend
 CORS(app)
 
-# Create one instance of the summarizer
+# Create one instance of the summarizer (reentrant, so it is shared by all threads)
 try:
     summarizer = ReviewSummarizer()
     print("✅ ReviewSummarizer loaded successfully.")
@@ -18,6 +23,23 @@ except Exception as e:
     summarizer = None
 
 
+def summary_response(summary: ReviewSummary) -> Response:
+    """Build the JSON response for a summary, compressed if the client accepts it"""
+    # Pretty-print exactly when jsonify would (compact unset and debug mode on)
+    compact = app.json.compact
+    body = encode_summary(
+        summary, pretty=compact is False or (compact is None and app.debug)
+    )
+    encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+    body, content_encoding = compress_body(body, encoding)
+
+    response = Response(body, mimetype="application/json")
+    if content_encoding:
+        response.headers["Content-Encoding"] = content_encoding
+    response.vary.add("Accept-Encoding")
+    return response
+
+
 @app.route("/summarize", methods=["POST"])
 def handle_summarize():
     if summarizer is None:
@@ -37,11 +59,9 @@ def handle_summarize():
         # Run the summary using your existing class
         summary = summarizer.summarize_reviews(reviews)
 
-        # Convert the Python dataclass object to a dictionary
-        summary_dict = asdict(summary)
-
         print("✅ Analysis complete. Sending summary.")
-        return jsonify(summary_dict)
+        # Encode the dataclass straight to JSON (no asdict copy)
+        return summary_response(summary)
 
     except ValueError as ve:
         print(f"❌ Value Error: {ve}", file=sys.stderr)
@@ -51,6 +71,12 @@ def handle_summarize():
         return jsonify({"error": "An internal server error occurred"}), 500
 
 
+# Warm up before serving so the first real request is fast (SUMMARIZER_WARM_UP=0 skips it)
+if summarizer is not None and os.environ.get("SUMMARIZER_WARM_UP", "1") != "0":
+    # Also encode and compress the result once to prime the response path
+    compress_body(encode_summary(summarizer.warm_up()), "gzip")
+
+
 if __name__ == "__main__":
     print("Starting Flask server at http://127.0.0.1:5000")
     app.run(debug=True, port=5000)
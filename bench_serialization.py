@@ -0,0 +1,52 @@
+"""
+Benchmark per-response serialization overhead for ReviewSummary
+
+Usage: python bench_serialization.py [num_reviews] [iterations]
+"""
+
+import sys
+import timeit
+from dataclasses import asdict
+
+from flask import Flask, jsonify
+
+from review_summarizer import ReviewSummarizer, create_sample_reviews
+from summary_serializer import compress_body, encode_summary
+
+
+def build_summary(num_reviews: int):
+    """Summarize num_reviews reviews built by cycling the sample set"""
+    samples = create_sample_reviews()
+    reviews = [samples[i % len(samples)] for i in range(num_reviews)]
+    return ReviewSummarizer().summarize_reviews(reviews)
+
+
+def main():
+    num_reviews = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    summary = build_summary(num_reviews)
+    app = Flask(__name__)
+    body = encode_summary(summary)
+
+    cases = {
+        "asdict + jsonify (old)": lambda: jsonify(asdict(summary)).get_data(),
+        "encode_summary": lambda: encode_summary(summary),
+        "encode_summary + gzip": lambda: compress_body(encode_summary(summary), "gzip"),
+        "encode_summary + deflate": lambda: compress_body(
+            encode_summary(summary), "deflate"
+        ),
+    }
+
+    print(f"Summary of {num_reviews} reviews, {len(body)} byte body")
+    print(f"{'case':<28}{'us/response':>12}{'bytes':>8}")
+    with app.app_context():
+        for name, case in cases.items():
+            seconds = min(timeit.repeat(case, number=iterations, repeat=5))
+            result = case()
+            size = len(result[0] if isinstance(result, tuple) else result)
+            print(f"{name:<28}{seconds / iterations * 1e6:>12.1f}{size:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark cold start: import time and time to the first /summarize response
+
+Each measurement runs in a fresh interpreter. Exits with status 1 if any
+median goes over its budget, so it can gate CI.
+
+Usage: python bench_startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+# Budgets in milliseconds for the median of each measurement, set at roughly
+# 2.5x the medians measured when they were introduced (9ms, 160ms and 170ms)
+# so a slower runner doesn't fail at random. The first measurement preloads
+# the stdlib modules review_summarizer uses and times only the module's own
+# import, which is stable and still catches a heavy dependency (with NumPy it
+# was 54ms).
+BUDGETS_MS = {
+    "review_summarizer own import": 25,
+    "import app (no warm-up)": 400,
+    "start to first /summarize": 450,
+}
+
+# Stdlib modules preloaded before timing review_summarizer's own import
+_STDLIB = (
+    "collections, dataclasses, hashlib, json, logging, math, re, threading, "
+    "types, typing"
+)
+
+_SCRIPTS = {
+    "review_summarizer own import": f"""
+import {_STDLIB}
+import time
+start = time.perf_counter()
+import review_summarizer
+print((time.perf_counter() - start) * 1000)
+""",
+    "import app (no warm-up)": """
+import os, time
+os.environ["SUMMARIZER_WARM_UP"] = "0"
+start = time.perf_counter()
+import app
+print((time.perf_counter() - start) * 1000)
+""",
+    "start to first /summarize": """
+import contextlib, io, time
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+    from review_summarizer import create_sample_reviews
+    response = app.app.test_client().post(
+        "/summarize", json={"reviews": create_sample_reviews()}
+    )
+assert response.status_code == 200, response.data
+print((time.perf_counter() - start) * 1000)
+""",
+}
+
+
+def measure(script: str) -> float:
+    """Run a script in a fresh interpreter and return the milliseconds it prints"""
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    over_budget = []
+
+    print(f"{'measurement':<28}{'median ms':>10}{'budget ms':>10}")
+    for name, script in _SCRIPTS.items():
+        median = statistics.median(measure(script) for _ in range(runs))
+        budget = BUDGETS_MS[name]
+        status = "" if median <= budget else "  ❌ over budget"
+        print(f"{name:<28}{median:>10.1f}{budget:>10}{status}")
+        if median > budget:
+            over_budget.append(name)
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+import argparse
+import gzip
+import json
+import math
+import sys
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from fractions import Fraction
+from typing import List, Dict
+
+from review_summarizer import ReviewSummarizer, ReviewSummary, mean_from_sum
+
+PARTIAL_FORMAT = "review-partial"
+PARTIAL_VERSION = 1
+
+
+@dataclass
+class PartialSummary:
+    """
+    Mergeable partial aggregate for a shard of reviews
+
+    Unlike ReviewSummary, nothing here is rounded or truncated, so any
+    number of partials can be merged into an exact ReviewSummary. Sums are
+    kept as Fractions so merging is associative (float addition is not).
+    Dict fields keep first-seen order, so partials must be merged in shard
+    order to reproduce the tie-breaking of a single-pass summary; each
+    partial records the range of shards it covers so merge_partials can
+    restore that order itself.
+    """
+
+    # Shards covered, inclusive, out of shard_count in the whole run
+    # (all None for an empty or unindexed partial)
+    first_shard: int = None
+    last_shard: int = None
+    shard_count: int = None
+    total_reviews: int = 0
+    rating_sum: Fraction = Fraction(0)
+    sentiment_sum: Fraction = Fraction(0)
+    review_length_sum: int = 0
+    sentiment_distribution: Dict[str, int] = field(
+        default_factory=lambda: {"positive": 0, "neutral": 0, "negative": 0}
+    )
+    rating_distribution: Dict[int, int] = field(
+        default_factory=lambda: {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
+    )
+    positive_phrases: Dict[str, int] = field(default_factory=dict)
+    negative_phrases: Dict[str, int] = field(default_factory=dict)
+    keyword_counts: Dict[str, int] = field(default_factory=dict)
+    # aspect -> [sentiment_sum, mention_count]
+    aspect_sentiments: Dict[str, List] = field(default_factory=dict)
+
+    @classmethod
+    def from_reviews(
+        cls,
+        summarizer: ReviewSummarizer,
+        reviews: List[Dict[str, any]],
+        shard_index: int = None,
+        shard_count: int = None,
+    ) -> "PartialSummary":
+        """Build the partial aggregate for one shard of reviews"""
+        partial = cls(
+            first_shard=shard_index,
+            last_shard=shard_index,
+            shard_count=shard_count,
+            total_reviews=len(reviews),
+        )
+        partial.check_shards()
+
+        for review in reviews:
+            text = review.get("text", "")
+            if not isinstance(text, str):
+                raise ValueError(f"Review text must be a string, got {text!r}")
+            rating = review.get("rating", 3)
+            if (
+                isinstance(rating, bool)
+                or not isinstance(rating, (int, float))
+                or not math.isfinite(rating)
+            ):
+                raise ValueError(
+                    f"Review rating must be a finite number, got {rating!r}"
+                )
+            sentiment = summarizer.calculate_sentiment_score(text)
+            partial.rating_sum += Fraction(rating)
+            partial.sentiment_sum += Fraction(sentiment)
+            partial.review_length_sum += len(text)
+            partial.sentiment_distribution[
+                summarizer.classify_sentiment(sentiment)
+            ] += 1
+
+        partial.rating_distribution = summarizer.get_rating_distribution(reviews)
+        partial.positive_phrases, partial.negative_phrases = summarizer.count_pros_cons(
+            reviews
+        )
+        partial.keyword_counts = dict(summarizer.count_keywords(reviews))
+        partial.aspect_sentiments = {
+            aspect: [sum(map(Fraction, sentiments), Fraction(0)), len(sentiments)]
+            for aspect, sentiments in summarizer.collect_aspect_sentiments(
+                reviews
+            ).items()
+        }
+        return partial
+
+    def check_shards(self):
+        """Raise ValueError if the shard range isn't a valid range of shard_count"""
+        if self.first_shard is None and self.last_shard is None:
+            return
+        if self.first_shard is None or self.last_shard is None:
+            raise ValueError("Shard range needs both a first and a last shard")
+        if not 0 <= self.first_shard <= self.last_shard:
+            raise ValueError(
+                f"Invalid shard range: first {self.first_shard}, last {self.last_shard}"
+            )
+        if self.shard_count is not None and self.last_shard >= self.shard_count:
+            raise ValueError(
+                f"Shard {self.last_shard} is out of range for "
+                f"{self.shard_count} shards"
+            )
+
+    def merge(self, other: "PartialSummary") -> "PartialSummary":
+        """Merge two partials into a new one (associative, order-preserving)"""
+        if None not in (self.shard_count, other.shard_count) and (
+            self.shard_count != other.shard_count
+        ):
+            raise ValueError(
+                f"Partials come from different runs: {self.shard_count} "
+                f"vs {other.shard_count} shards"
+            )
+        aspect_sentiments = {
+            aspect: list(values) for aspect, values in self.aspect_sentiments.items()
+        }
+        for aspect, (sentiment_sum, count) in other.aspect_sentiments.items():
+            current = aspect_sentiments.setdefault(aspect, [Fraction(0), 0])
+            current[0] += sentiment_sum
+            current[1] += count
+
+        return PartialSummary(
+            first_shard=_first_set(self.first_shard, other.first_shard),
+            last_shard=_first_set(other.last_shard, self.last_shard),
+            shard_count=_first_set(self.shard_count, other.shard_count),
+            total_reviews=self.total_reviews + other.total_reviews,
+            rating_sum=self.rating_sum + other.rating_sum,
+            sentiment_sum=self.sentiment_sum + other.sentiment_sum,
+            review_length_sum=self.review_length_sum + other.review_length_sum,
+            sentiment_distribution=_merge_counts(
+                self.sentiment_distribution, other.sentiment_distribution
+            ),
+            rating_distribution=_merge_counts(
+                self.rating_distribution, other.rating_distribution
+            ),
+            positive_phrases=_merge_counts(
+                self.positive_phrases, other.positive_phrases
+            ),
+            negative_phrases=_merge_counts(
+                self.negative_phrases, other.negative_phrases
+            ),
+            keyword_counts=_merge_counts(self.keyword_counts, other.keyword_counts),
+            aspect_sentiments=aspect_sentiments,
+        )
+
+    def to_summary(self, summarizer: ReviewSummarizer) -> ReviewSummary:
+        """Finalize the partial into the same ReviewSummary a single pass gives"""
+        if self.total_reviews == 0:
+            raise ValueError("No reviews provided")
+        if self.first_shard is not None:
+            # A final summary must cover the whole run, not just a contiguous part
+            last_shard = self.shard_count - 1 if self.shard_count is not None else None
+            if self.first_shard != 0 or last_shard not in (None, self.last_shard):
+                raise ValueError(
+                    f"Missing shards: partials cover {self.first_shard}-"
+                    f"{self.last_shard} of {self.shard_count or '?'} shards"
+                )
+
+        overall_score = summarizer.score_from_means(
+            mean_from_sum(self.rating_sum, self.total_reviews),
+            mean_from_sum(self.sentiment_sum, self.total_reviews),
+        )
+        aspect_analysis = {
+            aspect: summarizer.aspect_entry(sentiment_sum, count)
+            for aspect, (sentiment_sum, count) in self.aspect_sentiments.items()
+        }
+
+        summary = ReviewSummary(
+            overall_score=overall_score,
+            total_reviews=self.total_reviews,
+            sentiment_distribution=dict(self.sentiment_distribution),
+            pros=summarizer.rank_phrases(self.positive_phrases),
+            cons=summarizer.rank_phrases(self.negative_phrases),
+            top_keywords=summarizer.rank_keywords(Counter(self.keyword_counts)),
+            sentiment_trend=summarizer.trend_from_distribution(
+                self.sentiment_distribution
+            ),
+            detailed_insights={
+                "aspect_analysis": aspect_analysis,
+                "rating_distribution": dict(self.rating_distribution),
+                "average_review_length": mean_from_sum(
+                    self.review_length_sum, self.total_reviews
+                ),
+            },
+            executive_summary="",
+        )
+        summary.executive_summary = summarizer.generate_executive_summary(summary)
+        return summary
+
+    def to_dict(self) -> Dict[str, any]:
+        """Serialize to the versioned on-disk format"""
+        return {
+            "format": PARTIAL_FORMAT,
+            "version": PARTIAL_VERSION,
+            "first_shard": self.first_shard,
+            "last_shard": self.last_shard,
+            "shard_count": self.shard_count,
+            "total_reviews": self.total_reviews,
+            "rating_sum": str(self.rating_sum),
+            "sentiment_sum": str(self.sentiment_sum),
+            "review_length_sum": self.review_length_sum,
+            "sentiment_distribution": self.sentiment_distribution,
+            # JSON object keys must be strings, so keep ratings as pairs
+            "rating_distribution": list(self.rating_distribution.items()),
+            "positive_phrases": list(self.positive_phrases.items()),
+            "negative_phrases": list(self.negative_phrases.items()),
+            "keyword_counts": list(self.keyword_counts.items()),
+            "aspect_sentiments": [
+                [aspect, str(sentiment_sum), count]
+                for aspect, (sentiment_sum, count) in self.aspect_sentiments.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, any]) -> "PartialSummary":
+        """Load a partial from the versioned on-disk format"""
+        if not isinstance(data, dict) or data.get("format") != PARTIAL_FORMAT:
+            raise ValueError("Not a review partial-summary file")
+        if data.get("version") != PARTIAL_VERSION:
+            raise ValueError(
+                f"Unsupported partial-summary version: {data.get('version')}"
+            )
+
+        try:
+            partial = cls(
+                first_shard=data.get("first_shard"),
+                last_shard=data.get("last_shard"),
+                shard_count=data.get("shard_count"),
+                total_reviews=data["total_reviews"],
+                rating_sum=Fraction(data["rating_sum"]),
+                sentiment_sum=Fraction(data["sentiment_sum"]),
+                review_length_sum=data["review_length_sum"],
+                sentiment_distribution=dict(data["sentiment_distribution"]),
+                rating_distribution={
+                    rating: count for rating, count in data["rating_distribution"]
+                },
+                positive_phrases=dict(data["positive_phrases"]),
+                negative_phrases=dict(data["negative_phrases"]),
+                keyword_counts=dict(data["keyword_counts"]),
+                aspect_sentiments={
+                    aspect: [Fraction(sentiment_sum), count]
+                    for aspect, sentiment_sum, count in data["aspect_sentiments"]
+                },
+            )
+            partial.check_shards()
+            return partial
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Malformed partial-summary file: {e!r}") from e
+
+
+def _merge_counts(left: Dict, right: Dict) -> Dict:
+    """Add two count dicts, keeping left's key order and appending new keys"""
+    merged = dict(left)
+    for key, count in right.items():
+        merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+def _first_set(*values):
+    """First value that isn't None (None if all are)"""
+    return next((value for value in values if value is not None), None)
+
+
+def merge_partials(partials: List[PartialSummary]) -> PartialSummary:
+    """
+    Merge partials in shard order
+
+    Indexed partials are sorted by shard and must cover a contiguous run of
+    shards with no overlap. Unindexed partials are merged in the given order.
+    """
+    indexed = [partial.first_shard is not None for partial in partials]
+    if any(indexed):
+        if not all(indexed):
+            raise ValueError("Cannot mix partials with and without shard indexes")
+        partials = sorted(partials, key=lambda partial: partial.first_shard)
+        for previous, partial in zip(partials, partials[1:]):
+            if partial.first_shard != previous.last_shard + 1:
+                raise ValueError(
+                    f"Shards are not contiguous: {previous.last_shard} is "
+                    f"followed by {partial.first_shard}"
+                )
+
+    merged = PartialSummary()
+    for partial in partials:
+        merged = merged.merge(partial)
+    return merged
+
+
+def _open(path: str, mode: str):
+    """Open a file, transparently gzipping paths that end in .gz"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def load_reviews(path: str) -> List[Dict[str, any]]:
+    """Load a review shard: a JSON list or a {"reviews": [...]} object"""
+    with _open(path, "r") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("reviews")
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: reviews must be a list")
+    if not all(isinstance(review, dict) for review in data):
+        raise ValueError(f"{path}: each review must be an object")
+    return data
+
+
+def load_partial(path: str) -> PartialSummary:
+    with _open(path, "r") as f:
+        return PartialSummary.from_dict(json.load(f))
+
+
+def save_partial(partial: PartialSummary, path: str):
+    with _open(path, "w") as f:
+        json.dump(partial.to_dict(), f, separators=(",", ":"))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Map review shards to partial summaries and reduce them"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    map_parser = commands.add_parser(
+        "map", help="Build a partial summary from a review shard"
+    )
+    map_parser.add_argument("reviews", help="JSON file with a list of reviews")
+    map_parser.add_argument(
+        "--shard-index",
+        type=int,
+        required=True,
+        help="Position of this shard in the full review set (0, 1, 2, ...)",
+    )
+    map_parser.add_argument(
+        "--shard-count",
+        type=int,
+        required=True,
+        help="Total number of shards in the run",
+    )
+    map_parser.add_argument(
+        "-o", "--output", required=True, help="Partial summary file (.gz to compress)"
+    )
+
+    reduce_parser = commands.add_parser(
+        "reduce", help="Merge partial summaries (ordered by their shard index)"
+    )
+    reduce_parser.add_argument("partials", nargs="+", help="Partial summary files")
+    reduce_parser.add_argument(
+        "-o", "--output", required=True, help="Output file for the merged result"
+    )
+    reduce_parser.add_argument(
+        "--partial",
+        action="store_true",
+        help="Write a merged partial instead of a final summary (for tree reduction)",
+    )
+
+    args = parser.parse_args(argv)
+    summarizer = ReviewSummarizer()
+
+    try:
+        if args.command == "map":
+            reviews = load_reviews(args.reviews)
+            partial = PartialSummary.from_reviews(
+                summarizer, reviews, args.shard_index, args.shard_count
+            )
+            save_partial(partial, args.output)
+            print(f"Mapped {len(reviews)} reviews to {args.output}")
+            return 0
+
+        merged = merge_partials([load_partial(path) for path in args.partials])
+        if args.partial:
+            save_partial(merged, args.output)
+        else:
+            summary = merged.to_summary(summarizer)
+            with _open(args.output, "w") as f:
+                json.dump(asdict(summary), f, indent=2)
+        print(
+            f"Reduced {len(args.partials)} partials "
+            f"({merged.total_reviews} reviews) to {args.output}"
+        )
+        return 0
+
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,276 @@
 import re
+import hashlib
 import json
-from collections import Counter, defaultdict
-from dataclasses import dataclass, asdict
-import sys
-from typing import List, Dict, Tuple
-import numpy as np
+import logging
+import math
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass, field, asdict
+from types import MappingProxyType
+from typing import Callable, List, Dict, FrozenSet, Mapping, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Lexicons are built once at import and shared by every ReviewSummarizer
+
+# Positive and negative indicator words
+POSITIVE_WORDS = frozenset(
+    {
+        "excellent",
+        "great",
+        "amazing",
+        "wonderful",
+        "fantastic",
+        "perfect",
+        "love",
+        "best",
+        "awesome",
+        "brilliant",
+        "outstanding",
+        "superb",
+        "good",
+        "nice",
+        "happy",
+        "pleased",
+        "satisfied",
+        "recommend",
+        "quality",
+        "durable",
+        "reliable",
+        "comfortable",
+        "easy",
+        "fast",
+        "beautiful",
+        "sturdy",
+        "worth",
+        "impressed",
+        "exceeded",
+    }
+)
+
+NEGATIVE_WORDS = frozenset(
+    {
+        "bad",
+        "terrible",
+        "horrible",
+        "awful",
+        "poor",
+        "worst",
+        "hate",
+        "disappointing",
+        "disappointed",
+        "waste",
+        "useless",
+        "broken",
+        "defective",
+        "cheap",
+        "flimsy",
+        "uncomfortable",
+        "difficult",
+        "slow",
+        "unreliable",
+        "fragile",
+        "overpriced",
+        "regret",
+        "avoid",
+        "never",
+        "problem",
+        "issue",
+        "fail",
+    }
+)
+
+# Common stopwords to filter out
+STOPWORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "is",
+        "was",
+        "are",
+        "were",
+        "been",
+        "be",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "can",
+        "this",
+        "that",
+        "these",
+        "those",
+        "i",
+        "you",
+        "he",
+        "she",
+        "it",
+        "we",
+        "they",
+        "my",
+        "your",
+        "his",
+        "her",
+        "its",
+        "our",
+        "their",
+        "am",
+        "get",
+        "got",
+        "just",
+        "very",
+        "really",
+        "so",
+    }
+)
+
+# Aspect keywords for categorization
+ASPECT_KEYWORDS = MappingProxyType(
+    {
+        "quality": ("quality", "build", "material", "construction", "made"),
+        "price": ("price", "cost", "expensive", "cheap", "value", "worth"),
+        "durability": ("durable", "last", "lasting", "sturdy", "strong", "break"),
+        "design": ("design", "look", "appearance", "style", "aesthetic", "beautiful"),
+        "performance": ("performance", "work", "fast", "slow", "efficient", "speed"),
+        "comfort": ("comfort", "comfortable", "soft", "easy", "ergonomic"),
+        "delivery": ("delivery", "shipping", "arrive", "package", "received"),
+        "customer_service": ("service", "support", "customer", "help", "response"),
+    }
+)
+
+_NON_ALNUM = re.compile(r"[^a-z0-9\s]")
+_SENTENCE_END = re.compile(r"[.!?]+")
+
+
+def mean_from_sum(total, count: int) -> float:
+    """
+    Mean from an exact sum and a count
+
+    The single-pass summary and merged partial summaries (review_shards.py)
+    both average through this, so they always agree.
+    """
+    return float(total) / count
+
+
+def _mean(values) -> float:
+    """Mean of a non-empty sequence (fsum is the correctly rounded exact sum)"""
+    return mean_from_sum(math.fsum(values), len(values))
+
+
+_MISSING = object()
+
+
+class _ShardedCache:
+    """
+    Bounded cache for values computed from text, safe to share between threads
+
+    Entries are keyed on a 16-byte digest of the text, so memory is bounded
+    by the entry count however long the texts are. Keys are spread over
+    independently locked shards so concurrent callers rarely wait on each
+    other, and the shard capacities add up to exactly maxsize. Values are
+    computed outside the lock; two threads may compute the same value, which
+    is harmless for pure functions.
+    """
+
+    def __init__(self, maxsize: int, shards: int = 16):
+        shards = max(1, min(shards, maxsize))
+        self._enabled = maxsize > 0
+        self._shard_sizes = [
+            maxsize // shards + (1 if i < maxsize % shards else 0)
+            for i in range(shards)
+        ]
+        self._shards = [OrderedDict() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def get_or_compute(self, text: str, compute: Callable[[str], any]):
+        if not self._enabled:
+            return compute(text)
+
+        key = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        index = int.from_bytes(key[:4], "little") % len(self._shards)
+        shard, lock = self._shards[index], self._locks[index]
+
+        with lock:
+            value = shard.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = compute(text)
+        with lock:
+            shard[key] = value
+            # Evict oldest entries first once the shard is full
+            while len(shard) > self._shard_sizes[index]:
+                shard.popitem(last=False)
+        return value
+
+
+@dataclass(frozen=True)
+class SummarizerConfig:
+    """Immutable lexicons and settings, shared read-only by every call"""
+
+    positive_words: FrozenSet[str] = POSITIVE_WORDS
+    negative_words: FrozenSet[str] = NEGATIVE_WORDS
+    stopwords: FrozenSet[str] = STOPWORDS
+    aspect_keywords: Mapping[str, Tuple[str, ...]] = field(
+        default_factory=lambda: ASPECT_KEYWORDS
+    )
+    # Max number of texts whose sentiment score is cached (0 disables caching)
+    cache_size: int = 65536
+
+    def __post_init__(self):
+        # Freeze whatever was passed in so a config can never change after creation
+        object.__setattr__(self, "positive_words", frozenset(self.positive_words))
+        object.__setattr__(self, "negative_words", frozenset(self.negative_words))
+        object.__setattr__(self, "stopwords", frozenset(self.stopwords))
+        object.__setattr__(
+            self,
+            "aspect_keywords",
+            MappingProxyType(
+                {
+                    aspect: tuple(keywords)
+                    for aspect, keywords in self.aspect_keywords.items()
+                }
+            ),
+        )
+
+
+@dataclass
+class _SummaryContext:
+    """Per-call state for one summarize_reviews run (never kept on the summarizer)"""
+
+    reviews: List[Dict[str, any]]
+    review_sentiments: List[float]
+    # Where progress messages go (a no-op for quiet calls such as warm-up)
+    progress: Callable[..., None]
+
+
+def _no_progress(*args):
+    pass
 
 
 @dataclass
@@ -26,165 +292,47 @@ class ReviewSummarizer:
     """
     NLP-based Product Review Summarizer
     Extracts pros, cons, keywords, and sentiment from product reviews
+
+    Instances are reentrant: configuration is immutable, per-call state lives
+    in a context object, and the internal cache is thread-safe, so one
+    summarizer can be shared by all threads of a server.
     """
 
-    def __init__(self):
-        # Positive and negative indicator words
-        self.positive_words = {
-            "excellent",
-            "great",
-            "amazing",
-            "wonderful",
-            "fantastic",
-            "perfect",
-            "love",
-            "best",
-            "awesome",
-            "brilliant",
-            "outstanding",
-            "superb",
-            "good",
-            "nice",
-            "happy",
-            "pleased",
-            "satisfied",
-            "recommend",
-            "quality",
-            "durable",
-            "reliable",
-            "comfortable",
-            "easy",
-            "fast",
-            "beautiful",
-            "sturdy",
-            "worth",
-            "impressed",
-            "exceeded",
-        }
+    __slots__ = ("_config", "_sentiment_cache")
 
-        self.negative_words = {
-            "bad",
-            "terrible",
-            "horrible",
-            "awful",
-            "poor",
-            "worst",
-            "hate",
-            "disappointing",
-            "disappointed",
-            "waste",
-            "useless",
-            "broken",
-            "defective",
-            "cheap",
-            "flimsy",
-            "uncomfortable",
-            "difficult",
-            "slow",
-            "unreliable",
-            "fragile",
-            "overpriced",
-            "regret",
-            "avoid",
-            "never",
-            "problem",
-            "issue",
-            "fail",
-        }
+    def __init__(self, config: SummarizerConfig = None):
+        self._config = config or SummarizerConfig()
+        self._sentiment_cache = _ShardedCache(self._config.cache_size)
 
-        # Common stopwords to filter out
-        self.stopwords = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "is",
-            "was",
-            "are",
-            "were",
-            "been",
-            "be",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "can",
-            "this",
-            "that",
-            "these",
-            "those",
-            "i",
-            "you",
-            "he",
-            "she",
-            "it",
-            "we",
-            "they",
-            "my",
-            "your",
-            "his",
-            "her",
-            "its",
-            "our",
-            "their",
-            "am",
-            "get",
-            "got",
-            "just",
-            "very",
-            "really",
-            "so",
-        }
+    @property
+    def config(self) -> SummarizerConfig:
+        return self._config
 
-        # Aspect keywords for categorization
-        self.aspect_keywords = {
-            "quality": ["quality", "build", "material", "construction", "made"],
-            "price": ["price", "cost", "expensive", "cheap", "value", "worth"],
-            "durability": ["durable", "last", "lasting", "sturdy", "strong", "break"],
-            "design": [
-                "design",
-                "look",
-                "appearance",
-                "style",
-                "aesthetic",
-                "beautiful",
-            ],
-            "performance": [
-                "performance",
-                "work",
-                "fast",
-                "slow",
-                "efficient",
-                "speed",
-            ],
-            "comfort": ["comfort", "comfortable", "soft", "easy", "ergonomic"],
-            "delivery": ["delivery", "shipping", "arrive", "package", "received"],
-            "customer_service": ["service", "support", "customer", "help", "response"],
-        }
+    @property
+    def positive_words(self) -> FrozenSet[str]:
+        return self._config.positive_words
+
+    @property
+    def negative_words(self) -> FrozenSet[str]:
+        return self._config.negative_words
+
+    @property
+    def stopwords(self) -> FrozenSet[str]:
+        return self._config.stopwords
+
+    @property
+    def aspect_keywords(self) -> Mapping[str, Tuple[str, ...]]:
+        return self._config.aspect_keywords
+
+    def warm_up(self) -> ReviewSummary:
+        """Run a throwaway summary so the first real request doesn't pay setup costs"""
+        return self._summarize(create_sample_reviews(), progress=_no_progress)
 
     def preprocess_text(self, text: str) -> List[str]:
         """Preprocess and tokenize text"""
         # Convert to lowercase and remove special characters
         text = text.lower()
-        text = re.sub(r"[^a-z0-9\s]", " ", text)
+        text = _NON_ALNUM.sub(" ", text)
         # Tokenize
         tokens = text.split()
         # Remove stopwords
@@ -196,6 +344,10 @@ class ReviewSummarizer:
         Calculate sentiment score for a review
         Returns: float between -1 (negative) and 1 (positive)
         """
+        return self._sentiment_cache.get_or_compute(text, self._score_sentiment)
+
+    def _score_sentiment(self, text: str) -> float:
+        """Uncached sentiment score (see calculate_sentiment_score)"""
         tokens = self.preprocess_text(text)
         positive_count = sum(1 for token in tokens if token in self.positive_words)
         negative_count = sum(1 for token in tokens if token in self.negative_words)
@@ -219,7 +371,7 @@ class ReviewSummarizer:
     def extract_sentences(self, text: str) -> List[str]:
         """Extract sentences from text"""
         # Simple sentence splitting
-        sentences = re.split(r"[.!?]+", text)
+        sentences = _SENTENCE_END.split(text)
         sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
         return sentences
 
@@ -238,6 +390,16 @@ class ReviewSummarizer:
         Extract common pros and cons from reviews
         Returns: (pros, cons) as lists of (phrase, frequency) tuples
         """
+        positive_phrases, negative_phrases = self.count_pros_cons(reviews)
+        return self.rank_phrases(positive_phrases), self.rank_phrases(negative_phrases)
+
+    def count_pros_cons(
+        self, reviews: List[Dict[str, any]]
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Count every candidate pro and con phrase in the reviews
+        Returns: (positive_phrases, negative_phrases) in first-seen order
+        """
         positive_phrases = defaultdict(int)
         negative_phrases = defaultdict(int)
 
@@ -277,16 +439,22 @@ class ReviewSummarizer:
                         negative_phrases[f"{aspect}: {sentence[:50]}..."] += 1
                         break
 
-        # Get top pros and cons
-        pros = sorted(positive_phrases.items(), key=lambda x: x[1], reverse=True)[:10]
-        cons = sorted(negative_phrases.items(), key=lambda x: x[1], reverse=True)[:10]
+        return dict(positive_phrases), dict(negative_phrases)
 
-        return pros, cons
+    def rank_phrases(
+        self, phrases: Dict[str, int], top_n: int = 10
+    ) -> List[Tuple[str, int]]:
+        """Get the top phrases by frequency (ties keep first-seen order)"""
+        return sorted(phrases.items(), key=lambda x: x[1], reverse=True)[:top_n]
 
     def extract_keywords(
         self, reviews: List[Dict[str, any]], top_n: int = 20
     ) -> List[Tuple[str, int]]:
         """Extract top keywords from all reviews"""
+        return self.rank_keywords(self.count_keywords(reviews), top_n)
+
+    def count_keywords(self, reviews: List[Dict[str, any]]) -> Counter:
+        """Count every token across all reviews"""
         word_freq = Counter()
 
         for review in reviews:
@@ -294,6 +462,12 @@ class ReviewSummarizer:
             tokens = self.preprocess_text(text)
             word_freq.update(tokens)
 
+        return word_freq
+
+    def rank_keywords(
+        self, word_freq: Counter, top_n: int = 20
+    ) -> List[Tuple[str, int]]:
+        """Get the top keywords from token counts"""
         # Filter out very common words and return top keywords
         keywords = [
             (word, count)
@@ -311,16 +485,26 @@ class ReviewSummarizer:
         if not reviews:
             return 0.0
 
+        sentiments = [
+            self.calculate_sentiment_score(r.get("text", "")) for r in reviews
+        ]
+        return self._combine_scores(reviews, sentiments)
+
+    def _combine_scores(
+        self, reviews: List[Dict[str, any]], sentiments: List[float]
+    ) -> float:
+        """Overall score from the reviews and their sentiment scores"""
         # Calculate average rating
         ratings = [r.get("rating", 3) for r in reviews]
-        avg_rating = np.mean(ratings)
+        avg_rating = _mean(ratings)
 
         # Calculate average sentiment
-        sentiments = [
-            self.calculate_sentiment_score(r.get("text", "")) for r in reviews
-        ]
-        avg_sentiment = np.mean(sentiments)
+        avg_sentiment = _mean(sentiments)
 
+        return self.score_from_means(avg_rating, avg_sentiment)
+
+    def score_from_means(self, avg_rating: float, avg_sentiment: float) -> float:
+        """Overall score (0 to 5) from the average rating and average sentiment"""
         # Combine rating and sentiment (weighted)
         # Rating is more reliable, so give it 70% weight
         overall_score = (avg_rating * 0.7) + ((avg_sentiment + 1) * 2.5 * 0.3)
@@ -331,11 +515,15 @@ class ReviewSummarizer:
         self, reviews: List[Dict[str, any]]
     ) -> Dict[str, int]:
         """Analyze sentiment distribution across reviews"""
+        return self._distribution_from_scores(
+            self.calculate_sentiment_score(review.get("text", "")) for review in reviews
+        )
+
+    def _distribution_from_scores(self, sentiments) -> Dict[str, int]:
+        """Count review sentiment scores per sentiment class"""
         distribution = {"positive": 0, "neutral": 0, "negative": 0}
 
-        for review in reviews:
-            text = review.get("text", "")
-            sentiment_score = self.calculate_sentiment_score(text)
+        for sentiment_score in sentiments:
             sentiment_class = self.classify_sentiment(sentiment_score)
             distribution[sentiment_class] += 1
 
@@ -347,6 +535,10 @@ class ReviewSummarizer:
         Returns: string describing the trend
         """
         distribution = self.analyze_sentiment_distribution(reviews)
+        return self.trend_from_distribution(distribution)
+
+    def trend_from_distribution(self, distribution: Dict[str, int]) -> str:
+        """Describe the sentiment trend for a sentiment distribution"""
         total = sum(distribution.values())
 
         if total == 0:
@@ -370,6 +562,28 @@ class ReviewSummarizer:
         self, reviews: List[Dict[str, any]]
     ) -> Dict[str, Dict[str, float]]:
         """Analyze sentiment for different product aspects"""
+        aspect_sentiments = self.collect_aspect_sentiments(reviews)
+
+        # Calculate average sentiment per aspect
+        aspect_summary = {}
+        for aspect, sentiments in aspect_sentiments.items():
+            aspect_summary[aspect] = self.aspect_entry(
+                math.fsum(sentiments), len(sentiments)
+            )
+
+        return aspect_summary
+
+    def aspect_entry(self, sentiment_sum, mention_count: int) -> Dict[str, float]:
+        """Aspect analysis entry from an exact sentiment sum and a mention count"""
+        return {
+            "avg_sentiment": round(mean_from_sum(sentiment_sum, mention_count), 2),
+            "mention_count": mention_count,
+        }
+
+    def collect_aspect_sentiments(
+        self, reviews: List[Dict[str, any]]
+    ) -> Dict[str, List[float]]:
+        """Collect sentence sentiment scores per aspect, in first-seen order"""
         aspect_sentiments = defaultdict(list)
 
         for review in reviews:
@@ -381,18 +595,10 @@ class ReviewSummarizer:
                 sentiment = self.calculate_sentiment_score(sentence)
                 aspect_sentiments[aspect].append(sentiment)
 
-        # Calculate average sentiment per aspect
-        aspect_summary = {}
-        for aspect, sentiments in aspect_sentiments.items():
-            aspect_summary[aspect] = {
-                "avg_sentiment": round(np.mean(sentiments), 2),
-                "mention_count": len(sentiments),
-            }
-
-        return aspect_summary
+        return dict(aspect_sentiments)
 
     # --- 💡 NEW FUNCTION 💡 ---
-    def _generate_executive_summary(self, summary_data: ReviewSummary) -> str:
+    def generate_executive_summary(self, summary_data: ReviewSummary) -> str:
         """Generates a 2-3 line executive summary. Uses <b> tags for HTML bolding."""
 
         # Start with the main sentiment trend
@@ -444,7 +650,7 @@ class ReviewSummarizer:
 
         except (KeyError, IndexError, TypeError, RuntimeError) as e:
             # Fallback in case aspect analysis fails
-            print(f"Error generating aspect part of summary: {e}", file=sys.stderr)
+            logger.warning("Error generating aspect part of summary: %s", e)
             if summary_data.pros:
                 top_pro_text = summary_data.pros[0][0].split(":", 1)[0]
                 summary_text += (
@@ -464,42 +670,59 @@ class ReviewSummarizer:
         Returns:
             ReviewSummary object with all analysis results
         """
+        return self._summarize(reviews, progress=logger.info)
+
+    def _summarize(
+        self, reviews: List[Dict[str, any]], progress: Callable[..., None]
+    ) -> ReviewSummary:
+        """summarize_reviews, reporting progress through the given callable"""
         if not reviews:
             raise ValueError("No reviews provided")
 
-        print(f"Analyzing {len(reviews)} reviews...")
+        progress("Analyzing %d reviews...", len(reviews))
+
+        # Everything computed for this call lives here, not on self
+        ctx = _SummaryContext(
+            reviews=reviews,
+            review_sentiments=[
+                self.calculate_sentiment_score(r.get("text", "")) for r in reviews
+            ],
+            progress=progress,
+        )
 
         # Extract pros and cons
-        print("Extracting pros and cons...")
-        pros, cons = self.extract_pros_cons(reviews)
+        ctx.progress("Extracting pros and cons...")
+        pros, cons = self.extract_pros_cons(ctx.reviews)
 
         # Extract keywords
-        print("Extracting keywords...")
-        keywords = self.extract_keywords(reviews)
+        ctx.progress("Extracting keywords...")
+        keywords = self.extract_keywords(ctx.reviews)
 
         # Calculate scores and distributions
-        print("Calculating sentiment scores...")
-        overall_score = self.calculate_overall_score(reviews)
-        sentiment_distribution = self.analyze_sentiment_distribution(reviews)
-        sentiment_trend = self.identify_sentiment_trend(reviews)
+        ctx.progress("Calculating sentiment scores...")
+        overall_score = self._combine_scores(ctx.reviews, ctx.review_sentiments)
+        sentiment_distribution = self._distribution_from_scores(ctx.review_sentiments)
+        sentiment_trend = self.trend_from_distribution(sentiment_distribution)
 
         # Analyze aspects
-        print("Analyzing product aspects...")
-        aspect_analysis = self.analyze_aspects(reviews)
+        ctx.progress("Analyzing product aspects...")
+        aspect_analysis = self.analyze_aspects(ctx.reviews)
 
         # Create detailed insights
         detailed_insights = {
             "aspect_analysis": aspect_analysis,
-            "rating_distribution": self._get_rating_distribution(reviews),
-            "average_review_length": np.mean([len(r.get("text", "")) for r in reviews]),
+            "rating_distribution": self.get_rating_distribution(ctx.reviews),
+            "average_review_length": _mean(
+                [len(r.get("text", "")) for r in ctx.reviews]
+            ),
         }
 
-        print("Summary complete! Generating executive summary...")
+        ctx.progress("Summary complete! Generating executive summary...")
 
         # Create the initial summary object (with a temporary value)
         summary = ReviewSummary(
             overall_score=overall_score,
-            total_reviews=len(reviews),
+            total_reviews=len(ctx.reviews),
             sentiment_distribution=sentiment_distribution,
             pros=pros,
             cons=cons,
@@ -510,11 +733,11 @@ class ReviewSummarizer:
         )
 
         # Now, generate the exec summary using the data we just created
-        summary.executive_summary = self._generate_executive_summary(summary)
+        summary.executive_summary = self.generate_executive_summary(summary)
 
         return summary  # This summary object now includes the executive_summary string
 
-    def _get_rating_distribution(self, reviews: List[Dict[str, any]]) -> Dict[int, int]:
+    def get_rating_distribution(self, reviews: List[Dict[str, any]]) -> Dict[int, int]:
         """Get distribution of star ratings"""
         distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
         for review in reviews:
@@ -660,6 +883,8 @@ def create_sample_reviews():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Create summarizer instance
     summarizer = ReviewSummarizer()
 
@@ -0,0 +1,92 @@
+"""
+Stress test: one shared ReviewSummarizer under concurrent summarize_reviews calls
+
+Every threaded result is compared against serial execution of the same input.
+Exits with status 1 on any mismatch or error, so it can gate CI.
+
+Usage: python stress_summarizer.py [threads] [calls_per_thread]
+"""
+
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+
+from review_summarizer import ReviewSummarizer, SummarizerConfig, create_sample_reviews
+
+# Cache sizes to run with: the default, and one small enough to evict constantly
+CACHE_SIZES = (SummarizerConfig().cache_size, 8)
+
+
+def build_workloads(count: int, seed: int = 0):
+    """
+    Review sets of varying size and mix, so concurrent calls differ
+
+    Review texts are random runs of sample sentences, so there are far more
+    distinct texts (and cache keys) than sample reviews.
+    """
+    rng = random.Random(seed)
+    sentences = [
+        sentence.strip() + "."
+        for review in create_sample_reviews()
+        for sentence in review["text"].split(".")
+        if sentence.strip()
+    ]
+    return [
+        [
+            {
+                "text": " ".join(rng.sample(sentences, rng.randint(1, 4))),
+                "rating": rng.randint(1, 5),
+            }
+            for _ in range(rng.randint(1, 60))
+        ]
+        for _ in range(count)
+    ]
+
+
+def run_shared(workloads, expected, threads: int, cache_size: int) -> int:
+    """Run all workloads on one shared summarizer; returns the mismatch count"""
+    # Cache starts cold so threads race to fill (and evict from) it
+    shared = ReviewSummarizer(SummarizerConfig(cache_size=cache_size))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(shared.summarize_reviews, workloads))
+    elapsed = time.perf_counter() - start
+
+    mismatches = [
+        i for i, summary in enumerate(results) if asdict(summary) != expected[i]
+    ]
+    cached = len(shared._sentiment_cache)
+
+    print(
+        f"cache_size={cache_size}: {len(workloads)} calls on {threads} threads "
+        f"in {elapsed:.2f}s, {cached} texts cached, {len(mismatches)} mismatches"
+    )
+    for i in mismatches[:5]:
+        print(f"  ❌ call {i} differs from serial execution")
+    if cached > cache_size:
+        print(f"  ❌ cache holds {cached} texts, over its limit of {cache_size}")
+        return len(mismatches) + 1
+    return len(mismatches)
+
+
+def main() -> int:
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    calls_per_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    workloads = build_workloads(threads * calls_per_thread)
+
+    # Serial reference results from an uncached summarizer
+    serial = ReviewSummarizer(SummarizerConfig(cache_size=0))
+    expected = [asdict(serial.summarize_reviews(reviews)) for reviews in workloads]
+
+    failures = sum(
+        run_shared(workloads, expected, threads, cache_size)
+        for cache_size in CACHE_SIZES
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import gzip
+import json
+import zlib
+from dataclasses import fields
+from typing import Optional, Tuple
+
+from review_summarizer import ReviewSummary
+
+# Encodings we can compress responses with, in order of preference
+SUPPORTED_ENCODINGS = ("gzip", "deflate")
+
+# Bodies smaller than this are sent as-is; compressing them costs more than it saves
+MIN_COMPRESS_SIZE = 512
+
+_SUMMARY_FIELDS = tuple(f.name for f in fields(ReviewSummary))
+
+
+def _default(obj):
+    """Encode the few types json can't handle on its own"""
+    if isinstance(obj, ReviewSummary):
+        # Shallow view of the fields: nested values are encoded in place, not copied
+        return {name: getattr(obj, name) for name in _SUMMARY_FIELDS}
+    # NumPy scalars and arrays (np.float64 is a float subclass and never gets here)
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Same output settings as Flask's jsonify (sorted keys, ASCII-only), compact
+# as outside debug mode or indented as in debug mode
+_compact_encoder = json.JSONEncoder(
+    default=_default, sort_keys=True, separators=(",", ":"), ensure_ascii=True
+)
+_indented_encoder = json.JSONEncoder(
+    default=_default, sort_keys=True, indent=2, ensure_ascii=True
+)
+
+
+def encode_summary(summary: ReviewSummary, pretty: bool = False) -> bytes:
+    """
+    Encode a ReviewSummary straight to JSON bytes
+
+    Produces the same body as jsonify(asdict(summary)) without deep-copying
+    the summary into an intermediate dict first: compact by default, or
+    indented (as jsonify does in debug mode) when pretty is True.
+    """
+    encoder = _indented_encoder if pretty else _compact_encoder
+    return (encoder.encode(summary) + "\n").encode("ascii")
+
+
+def compress_body(
+    body: bytes, encoding: Optional[str], level: int = 6
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Compress a response body with the negotiated encoding
+
+    Returns: (body, content_encoding); content_encoding is None when the
+    body was left uncompressed
+    """
+    if encoding not in SUPPORTED_ENCODINGS or len(body) < MIN_COMPRESS_SIZE:
+        return body, None
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=level, mtime=0), "gzip"
+    # HTTP "deflate" is the zlib format, not a raw deflate stream
+    return zlib.compress(body, level), "deflate"